@@ -0,0 +1,104 @@
+import random
+
+# Каталог вражеских кораблей (по аналогии с характеристиками кораблей игрока)
+enemy_types = {
+    1: {'name': 'Alien Destroyer', 'health': 50, 'protection': 3, 'attack': 5},
+    2: {'name': 'Alien Scout', 'health': 25, 'protection': 1, 'attack': 4},
+    3: {'name': 'Alien Cruiser', 'health': 80, 'protection': 4, 'attack': 7},
+    4: {'name': 'Alien Dreadnought', 'health': 140, 'protection': 6, 'attack': 10},
+    5: {'name': 'Pirate Raider', 'health': 35, 'protection': 2, 'attack': 6},
+}
+
+# Звёздные системы для патрулирования
+systems = {
+    1: 'Orion',
+    2: 'Deneb',
+    3: 'Arcturus',
+}
+
+# Таблицы встреч: для каждой системы список (тип врага, вес)
+encounter_tables = {
+    1: [(2, 50), (1, 30), (5, 20)],
+    2: [(1, 40), (3, 35), (5, 25)],
+    3: [(3, 40), (1, 35), (4, 25)],
+}
+
+
+# Функция для построения alias-таблицы (метод Уокера-Воуза)
+def build_alias_table(weights):
+    if any(w < 0 for w in weights):
+        raise ValueError("Encounter weights must not be negative")
+    n = len(weights)
+    total = sum(weights)
+    if n == 0 or total <= 0:
+        raise ValueError("Encounter table must have a positive total weight")
+
+    scaled = [w * n / total for w in weights]
+    prob = [0.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = scaled[l] + scaled[s] - 1.0
+        if scaled[l] < 1.0:
+            small.append(l)
+        else:
+            large.append(l)
+
+    # Оставшиеся столбцы заполнены целиком (с точностью до погрешности)
+    for i in large + small:
+        prob[i] = 1.0
+
+    return prob, alias
+
+
+# Функция для компиляции таблицы встреч системы
+def compile_encounter_table(entries):
+    types = [enemy for enemy, weight in entries]
+    prob, alias = build_alias_table([weight for enemy, weight in entries])
+    return {
+        'types': types,
+        'prob': prob,
+        'alias_types': [types[i] for i in alias],
+    }
+
+
+# Таблицы компилируются один раз при загрузке модуля
+compiled_tables = {system: compile_encounter_table(entries)
+                   for system, entries in encounter_tables.items()}
+
+
+# Функция для выбора типа врага за O(1)
+def sample_encounter(system, rng=random):
+    table = compiled_tables[system]
+    u = rng.random() * len(table['types'])
+    i = int(u)
+    if u - i < table['prob'][i]:
+        return table['types'][i]
+    return table['alias_types'][i]
+
+
+# Функция для пакетного выбора встреч (для симуляций)
+def sample_encounters(system, count, rng=random):
+    table = compiled_tables[system]
+    types = table['types']
+    prob = table['prob']
+    alias_types = table['alias_types']
+    n = len(types)
+    rand = rng.random
+    result = [0] * count
+    for k in range(count):
+        u = rand() * n
+        i = int(u)
+        result[k] = types[i] if u - i < prob[i] else alias_types[i]
+    return result
+
+
+# Функция для создания врага по таблице встреч системы
+def spawn_enemy(system, rng=random):
+    return dict(enemy_types[sample_encounter(system, rng)])
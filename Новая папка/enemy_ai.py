@@ -0,0 +1,210 @@
+import math
+import random
+import time
+from collections import OrderedDict
+
+# Действия вражеского корабля в бою
+ATTACK = 'attack'  # Обычный выстрел: attack - protection
+HEAVY = 'heavy'    # Залп двойной силы, попадает с вероятностью HEAVY_HIT_CHANCE
+SHIELD = 'shield'  # Щиты поглощают половину урона от следующей атаки игрока
+REPAIR = 'repair'  # Ремонт корпуса на REPAIR_AMOUNT, не больше REPAIRS раз за бой
+ACTIONS = [ATTACK, HEAVY, SHIELD, REPAIR]
+
+HEAVY_HIT_CHANCE = 0.5
+REPAIR_AMOUNT = 15
+REPAIRS = 2
+
+# Состояние щитов: готовы или перезаряжаются (нельзя поднять два хода подряд)
+SHIELD_READY = 0
+SHIELD_RECHARGE = 1
+
+
+# Функция для расчёта урона от атаки игрока с учётом щитов врага.
+# Щиты подняты в тот ход, после которого они перезаряжаются
+def shielded_damage(shield, damage):
+    if shield == SHIELD_RECHARGE:
+        return damage // 2
+    return damage
+
+
+# Противник, выбирающий действия поиском по дереву Монте-Карло (UCT).
+# Состояние боя перед ходом врага: (player_health, enemy_health, shield, repairs).
+# Статистика узлов хранится в таблице транспозиций с ключами Зобриста,
+# поэтому повторяющиеся состояния используются повторно внутри хода и между ходами.
+class EnemyAI:
+    def __init__(self, player_damage, player_protection, enemy_attack, enemy_protection,
+                 enemy_max_health, player_max_health=30, time_budget=0.05, table_size=50000,
+                 exploration=1.4, max_depth=40, rng=None):
+        self.player_damage = player_damage
+        self.player_protection = player_protection
+        self.enemy_attack = enemy_attack
+        self.enemy_protection = enemy_protection
+        self.enemy_max_health = enemy_max_health
+        self.player_max_health = player_max_health
+        self.time_budget = time_budget
+        self.table_size = table_size
+        self.exploration = exploration
+        self.max_depth = max_depth
+        self.rng = rng or random.Random()
+
+        self.table = OrderedDict()
+        # Случайные ключи Зобриста для каждого значения каждого признака состояния.
+        # Хешируются только состояния идущего боя: здоровье обеих сторон не меньше 1
+        zobrist_rng = random.Random(0x5EED)
+        self.zobrist = [
+            [zobrist_rng.getrandbits(64) for _ in range(limit + 1)]
+            for limit in (player_max_health, enemy_max_health, SHIELD_RECHARGE, REPAIRS)
+        ]
+        self.evictions = 0
+        self.last_stats = None
+
+    # Функция для выбора действия врага в пределах бюджета времени
+    def choose_action(self, state):
+        legal = self.legal_actions(state)
+        if len(legal) == 1:
+            self.last_stats = self._stats(0, 0, 0, 0.0)
+            return legal[0]
+
+        iterations = 0
+        nodes = 0
+        hits = 0
+        start = time.perf_counter()
+        deadline = start + self.time_budget
+        while iterations == 0 or time.perf_counter() < deadline:
+            visited, reused = self._iterate(state)
+            iterations += 1
+            nodes += visited
+            hits += reused
+        elapsed = time.perf_counter() - start
+
+        entry = self.table.get(self.hash(state))
+        self.last_stats = self._stats(iterations, nodes, hits, elapsed)
+        if entry is None:
+            return ATTACK
+        return max(legal, key=lambda action: entry[1][action][0])
+
+    # Функция для получения допустимых действий в состоянии
+    def legal_actions(self, state):
+        player_health, enemy_health, shield, repairs = state
+        actions = [ATTACK, HEAVY]
+        if shield != SHIELD_RECHARGE:
+            actions.append(SHIELD)
+        if repairs > 0 and enemy_health < self.enemy_max_health:
+            actions.append(REPAIR)
+        return actions
+
+    # Функция для вычисления ключа Зобриста состояния
+    def hash(self, state):
+        player_health, enemy_health, shield, repairs = state
+        player_keys, enemy_keys, shield_keys, repair_keys = self.zobrist
+        return (player_keys[player_health] ^ enemy_keys[enemy_health]
+                ^ shield_keys[shield] ^ repair_keys[repairs])
+
+    # Функция для применения действия врага (общие правила для поиска и для игры).
+    # Возвращает новое состояние и урон, нанесённый кораблю игрока
+    def apply_action(self, state, action):
+        player_health, enemy_health, shield, repairs = state
+        damage = 0
+        if action == ATTACK:
+            damage = max(0, self.enemy_attack - self.player_protection)
+        elif action == HEAVY:
+            if self.rng.random() < HEAVY_HIT_CHANCE:
+                damage = max(0, 2 * self.enemy_attack - self.player_protection)
+        elif action == REPAIR:
+            enemy_health = min(self.enemy_max_health, enemy_health + REPAIR_AMOUNT)
+            repairs -= 1
+        shield = SHIELD_RECHARGE if action == SHIELD else SHIELD_READY
+        return (player_health - damage, enemy_health, shield, repairs), damage
+
+    # Функция для перехода: ход врага и ответная атака игрока.
+    # Возвращает новое состояние и результат (1 - победа врага, 0 - поражение, None - бой идёт)
+    def step(self, state, action):
+        state, _ = self.apply_action(state, action)
+        player_health, enemy_health, shield, repairs = state
+        if player_health <= 0:
+            return state, 1.0
+
+        enemy_health -= shielded_damage(shield, max(0, self.player_damage - self.enemy_protection))
+        if enemy_health <= 0:
+            return (player_health, enemy_health, shield, repairs), 0.0
+        return (player_health, enemy_health, shield, repairs), None
+
+    # Функция для оценки незавершённого боя по остатку здоровья
+    def evaluate(self, state):
+        player_health, enemy_health, shield, repairs = state
+        player_left = player_health / max(1, self.player_max_health)
+        enemy_left = enemy_health / max(1, self.enemy_max_health)
+        return 0.5 + 0.5 * (enemy_left - player_left)
+
+    def _iterate(self, root):
+        path = []
+        state = root
+        visited = 0
+        reused = 0
+        value = None
+        depth = 0
+        while value is None:
+            key = self.hash(state)
+            entry = self.table.get(key)
+            visited += 1
+            if entry is None:
+                self._store(key, [0, {action: [0, 0.0] for action in self.legal_actions(state)}])
+                value = self._rollout(state, depth)
+                break
+            reused += 1
+            self.table.move_to_end(key)
+            action = self._select(entry)
+            path.append((entry, action))
+            state, value = self.step(state, action)
+            depth += 1
+            if value is None and depth >= self.max_depth:
+                value = self.evaluate(state)
+
+        for entry, action in path:
+            entry[0] += 1
+            stats = entry[1][action]
+            stats[0] += 1
+            stats[1] += value
+        return visited, reused
+
+    def _select(self, entry):
+        visits, children = entry
+        log_visits = math.log(visits + 1)
+        best = None
+        best_score = -1.0
+        for action, (count, total) in children.items():
+            if count == 0:
+                return action
+            score = total / count + self.exploration * math.sqrt(log_visits / count)
+            if score > best_score:
+                best = action
+                best_score = score
+        return best
+
+    def _rollout(self, state, depth):
+        rng = self.rng
+        while depth < self.max_depth:
+            legal = self.legal_actions(state)
+            state, value = self.step(state, legal[int(rng.random() * len(legal))])
+            if value is not None:
+                return value
+            depth += 1
+        return self.evaluate(state)
+
+    def _store(self, key, entry):
+        self.table[key] = entry
+        if len(self.table) > self.table_size:
+            # Вытесняем давно не использованные узлы (LRU)
+            self.table.popitem(last=False)
+            self.evictions += 1
+
+    def _stats(self, iterations, nodes, hits, elapsed):
+        return {
+            'iterations': iterations,
+            'nodes': nodes,
+            'tt_hits': hits,
+            'tt_size': len(self.table),
+            'evictions': self.evictions,
+            'elapsed': elapsed,
+            'nodes_per_second': nodes / elapsed if elapsed > 0 else 0.0,
+        }
@@ -0,0 +1,83 @@
+import re
+import sys
+import types
+from typing import Callable, Dict, List
+
+
+class FakeEvent:
+    """Событие, передаваемое обработчикам (аналог DOM-события Brython)"""
+    def __init__(self, event_type: str, target: 'FakeElement'):
+        self.type = event_type
+        self.target = target
+
+
+class FakeElement:
+    """Элемент страницы с полями, которые использует script.py"""
+    def __init__(self, element_id: str):
+        self.id = element_id
+        self.innerHTML = ""
+        self.value = ""
+        self.scrollTop = 0
+        self.handlers: Dict[str, List[Callable]] = {}
+
+    @property
+    def scrollHeight(self) -> int:
+        return self.innerHTML.count("<br>")
+
+    def bind(self, event_type: str, handler: Callable):
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def unbind(self, event_type: str, handler: Callable = None):
+        if handler is None:
+            self.handlers.pop(event_type, None)
+        elif handler in self.handlers.get(event_type, []):
+            self.handlers[event_type].remove(handler)
+
+    def dispatch(self, event_type: str) -> bool:
+        """Вызывает обработчики события, возвращает False, если их нет"""
+        handlers = list(self.handlers.get(event_type, []))
+        event = FakeEvent(event_type, self)
+        for handler in handlers:
+            handler(event)
+        return bool(handlers)
+
+    def click(self) -> bool:
+        return self.dispatch("click")
+
+
+class FakeDocument:
+    """Замена browser.document с элементами из index.html"""
+    ELEMENT_IDS = ("console", "user_input", "submit_button")
+
+    def __init__(self):
+        self.elements: Dict[str, FakeElement] = {}
+        self.reset()
+
+    def reset(self):
+        self.elements = {element_id: FakeElement(element_id) for element_id in self.ELEMENT_IDS}
+
+    def __getitem__(self, element_id: str) -> FakeElement:
+        return self.elements[element_id]
+
+    def __contains__(self, element_id: str) -> bool:
+        return element_id in self.elements
+
+    def submit(self, text: str) -> bool:
+        """Вводит текст в поле и нажимает кнопку, возвращает False, если игра не ждёт ввода"""
+        self["user_input"].value = text
+        return self["submit_button"].click()
+
+    def console_lines(self) -> List[str]:
+        """Возвращает текст консоли построчно, без HTML-тегов"""
+        html = self["console"].innerHTML
+        return [re.sub(r'<[^>]+>', '', line) for line in html.split("<br>")]
+
+
+def install() -> FakeDocument:
+    """Регистрирует модуль browser с FakeDocument вместо настоящего документа"""
+    module = sys.modules.get("browser")
+    if module is None or not isinstance(getattr(module, "document", None), FakeDocument):
+        module = types.ModuleType("browser")
+        module.document = FakeDocument()
+        sys.modules["browser"] = module
+    return module.document
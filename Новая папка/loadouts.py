@@ -0,0 +1,154 @@
+from main import weapons, ship_stats
+
+# Загрузка корабля хранится как вектор количеств фиксированной длины:
+# counts[i] - сколько единиц оружия weapon_ids[i] на борту.
+#
+# Какие загрузки допустимы, зависит от версии игры:
+# - консольная (main.load_weapons): оружие 1-5 в любом количестве, выбор
+#   заканчивается только когда отсек заполнен полностью;
+# - веб (script.py): оружие 1-4, каждое не больше одного раза, выбор тоже
+#   заканчивается только на полном отсеке. Всё оружие 1-4 занимает 22 единицы,
+#   поэтому для крейсера и линкора таких загрузок нет (индекс пуст).
+# По умолчанию индекс содержит только полностью заполненные отсеки (exact=True);
+# exact=False включает все загрузки, которые помещаются в отсек.
+
+# Оружие веб-версии (совпадает с weapons в script.py)
+web_weapons = {weapon: weapons[weapon] for weapon in (1, 2, 3, 4)}
+
+
+# Индекс всех допустимых загрузок для заданного грузового отсека.
+# Загрузки упорядочены лексикографически по векторам количеств,
+# rank/unrank переводят вектор в номер 0..len(index)-1 и обратно.
+class LoadoutIndex:
+    def __init__(self, cargo_space, catalog=weapons, exact=True, max_count=None):
+        self.cargo_space = cargo_space
+        self.catalog = catalog
+        self.exact = exact
+        self.max_count = max_count
+        self.weapon_ids = sorted(catalog)
+        self.sizes = [catalog[weapon]['cargo'] for weapon in self.weapon_ids]
+        self.positions = {weapon: i for i, weapon in enumerate(self.weapon_ids)}
+
+        # ways[i][c] - число допустимых векторов для оружия с позиции i и дальше
+        # при свободном месте c;
+        # prefix[i][c] - то же без ограничения max_count на позиции i, отсюда
+        # число векторов с количеством меньше k: prefix[i][c] - prefix[i][c - k * size]
+        n = len(self.sizes)
+        last = [1 if c == 0 or not exact else 0 for c in range(cargo_space + 1)]
+        self.ways = [[0] * (cargo_space + 1) for _ in range(n)] + [last]
+        self.prefix = [[0] * (cargo_space + 1) for _ in range(n)]
+        for i in reversed(range(n)):
+            size = self.sizes[i]
+            row = self.ways[i]
+            prefix = self.prefix[i]
+            below = self.ways[i + 1]
+            for c in range(cargo_space + 1):
+                prefix[c] = below[c] + (prefix[c - size] if c >= size else 0)
+                row[c] = prefix[c]
+                if max_count is not None and c >= (max_count + 1) * size:
+                    row[c] -= prefix[c - (max_count + 1) * size]
+        self.size = self.ways[0][cargo_space]
+
+    def __len__(self):
+        return self.size
+
+    # Функция для получения номера загрузки
+    def rank(self, counts):
+        if len(counts) != len(self.sizes):
+            raise ValueError(f"Expected {len(self.sizes)} weapon counts, got {len(counts)}")
+        result = 0
+        free = self.cargo_space
+        for i, count in enumerate(counts):
+            if not isinstance(count, int):
+                raise TypeError(f"Weapon counts must be integers, got {count!r}")
+            if count < 0:
+                raise ValueError(f"Weapon counts must not be negative, got {count}")
+            used = count * self.sizes[i]
+            if used > free:
+                raise ValueError("Loadout does not fit into cargo space")
+            if self.max_count is not None and count > self.max_count:
+                raise ValueError(f"At most {self.max_count} of each weapon is allowed")
+            # Все векторы с меньшим количеством на позиции i идут раньше
+            result += self.prefix[i][free] - self.prefix[i][free - used]
+            free -= used
+        if self.exact and free != 0:
+            raise ValueError("Loadout does not fill the cargo space")
+        return result
+
+    # Функция для получения загрузки по номеру
+    def unrank(self, number):
+        if not isinstance(number, int):
+            raise TypeError(f"Loadout number must be an integer, got {number!r}")
+        if not 0 <= number < self.size:
+            raise IndexError(f"Loadout number {number} is out of range 0..{self.size - 1}")
+        counts = []
+        free = self.cargo_space
+        for i, size in enumerate(self.sizes):
+            below = self.ways[i + 1]
+            count = 0
+            while number >= below[free]:
+                number -= below[free]
+                free -= size
+                count += 1
+            counts.append(count)
+        return tuple(counts)
+
+    # Перебор всех загрузок в порядке номеров (без вызова unrank).
+    # Ветви без допустимого продолжения (ways == 0) пропускаются
+    def __iter__(self):
+        n = len(self.sizes)
+        counts = [0] * n
+
+        def fill(i, free):
+            if i == n:
+                yield tuple(counts)
+                return
+            below = self.ways[i + 1]
+            count = 0
+            while free >= 0 and (self.max_count is None or count <= self.max_count):
+                if below[free]:
+                    counts[i] = count
+                    yield from fill(i + 1, free)
+                free -= self.sizes[i]
+                count += 1
+            counts[i] = 0
+
+        if self.size:
+            yield from fill(0, self.cargo_space)
+
+    # Функция для перевода загрузки консольной версии: список (оружие, количество)
+    def counts_from_loadout(self, loadout):
+        counts = [0] * len(self.sizes)
+        for weapon, qty in loadout:
+            counts[self.positions[weapon]] += qty
+        return tuple(counts)
+
+    # Функция для перевода загрузки веб-версии: список словарей оружия
+    def counts_from_weapons(self, weapon_list):
+        names = {self.catalog[weapon]['name']: weapon for weapon in self.weapon_ids}
+        return self.counts_from_loadout([(names[weapon['name']], 1) for weapon in weapon_list])
+
+    # Функция для обратного перевода в список (оружие, количество)
+    def loadout_from_counts(self, counts):
+        return [(weapon, count) for weapon, count in zip(self.weapon_ids, counts) if count]
+
+    # Функция для подсчёта занятого места
+    def cargo_used(self, counts):
+        return sum(count * size for count, size in zip(counts, self.sizes))
+
+
+# Индексы строятся один раз для каждого размера отсека
+indexes = {}
+
+
+# Функция для получения индекса загрузок корабля (1-3) по правилам
+# консольной версии или веб-версии (web=True)
+def index_for_ship(choice, web=False):
+    cargo_space = ship_stats(choice)['cargo_space']
+    key = (cargo_space, web)
+    if key not in indexes:
+        if web:
+            indexes[key] = LoadoutIndex(cargo_space, web_weapons, max_count=1)
+        else:
+            indexes[key] = LoadoutIndex(cargo_space)
+    return indexes[key]
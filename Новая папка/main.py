@@ -1,4 +1,28 @@
 import random
+import shutil
+import sys
+
+from screen import ScreenRenderer
+
+# Характеристики оружия
+weapons = {
+    1: {'name': 'Phaser Banks', 'cargo': 12, 'strength': 4},
+    2: {'name': 'Anti-Matter Missile', 'cargo': 4, 'strength': 20},
+    3: {'name': 'Hyperspace Lance', 'cargo': 4, 'strength': 16},
+    4: {'name': 'Photon Torpedo', 'cargo': 2, 'strength': 10},
+    5: {'name': 'Hyperon Neutralization Field', 'cargo': 20, 'strength': 6},
+}
+
+# Таблица оружия (общая для обычного и полноэкранного режима)
+weapons_table = [
+    "Choose your weaponry:",
+    "TYPE                         CARGO SPACE    REL. STRENGTH",
+    "1. PHASER BANKS                   12                4",
+    "2. ANTI-MATTER MISSILE             4               20",
+    "3. HYPERSPACE LANCE                4               16",
+    "4. PHOTON TORPEDO                  2               10",
+    "5. HYPERON NEUTRALIZATION FIELD   20                6",
+]
 
 # Функция для печати текста с отступом
 def print_tab(spaces, text):
@@ -55,37 +79,69 @@ def ship_stats(choice):
 
 # Функция для показа списка доступного оружия
 def show_weapons():
-    print("\nChoose your weaponry:")
-    print("TYPE                         CARGO SPACE    REL. STRENGTH")
-    print("1. PHASER BANKS                   12                4")
-    print("2. ANTI-MATTER MISSILE             4               20")
-    print("3. HYPERSPACE LANCE                4               16")
-    print("4. PHOTON TORPEDO                  2               10")
-    print("5. HYPERON NEUTRALIZATION FIELD   20                6")
+    print()
+    for line in weapons_table:
+        print(line)
+
+# Функция для создания полноэкранного режима с фиксированными областями.
+# Возвращает None, если области не помещаются в терминал
+def create_screen():
+    size = shutil.get_terminal_size()
+    # Строка подсказки - 18-я, ещё одна строка нужна под перевод строки после ввода
+    need_width = max(len(line) for line in weapons_table)
+    need_height = 19
+    if size.columns < need_width or size.lines < need_height:
+        print(f"Terminal is too small for --screen ({size.columns}x{size.lines}, "
+              f"need {need_width}x{need_height}), using plain mode.")
+        return None
+    screen = ScreenRenderer(width=size.columns, height=size.lines)
+    screen.add_region('ship', 0, 4)
+    screen.add_region('weapons', 5, len(weapons_table))
+    screen.add_region('cargo', 13, 1)
+    screen.add_region('message', 15, 1)
+    screen.add_region('prompt', 17, 1)
+    return screen
+
+# Функция для вывода панели корабля в полноэкранном режиме
+def show_ship_panel(screen, choice, stats):
+    names = {1: 'SCOUT', 2: 'CRUISER', 3: 'BATTLESHIP'}
+    screen.update('ship', [
+        f"SHIP: {names[choice]}",
+        f"SPEED: {stats['speed']}X",
+        f"CARGO SPACE: {stats['cargo_space']}",
+        f"PROTECTION: {stats['protection']}",
+    ])
+
+# Функция для вывода сообщения (в консоль или в область экрана)
+def show_message(text, screen=None):
+    if screen is None:
+        print(text)
+    else:
+        screen.update('message', [text])
 
 # Функция для загрузки оружия на корабль
-def load_weapons(cargo_space):
-    weapons = {
-        1: {'name': 'Phaser Banks', 'cargo': 12, 'strength': 4},
-        2: {'name': 'Anti-Matter Missile', 'cargo': 4, 'strength': 20},
-        3: {'name': 'Hyperspace Lance', 'cargo': 4, 'strength': 16},
-        4: {'name': 'Photon Torpedo', 'cargo': 2, 'strength': 10},
-        5: {'name': 'Hyperon Neutralization Field', 'cargo': 20, 'strength': 6},
-    }
+def load_weapons(cargo_space, screen=None):
     loadout = []
     while cargo_space > 0:
-        show_weapons()
-        weapon_choice = int(input(f"Choose a weapon (1-5), remaining cargo space: {cargo_space}: "))
+        if screen is None:
+            show_weapons()
+            weapon_choice = int(input(f"Choose a weapon (1-5), remaining cargo space: {cargo_space}: "))
+        else:
+            screen.update('cargo', [f"REMAINING CARGO SPACE: {cargo_space}"])
+            weapon_choice = int(screen.ask('prompt', "Choose a weapon (1-5): "))
         if weapon_choice in weapons:
-            weapon_qty = int(input(f"How many {weapons[weapon_choice]['name']}? "))
+            prompt = f"How many {weapons[weapon_choice]['name']}? "
+            weapon_qty = int(input(prompt) if screen is None else screen.ask('prompt', prompt))
             total_cargo = weapon_qty * weapons[weapon_choice]['cargo']
             if total_cargo <= cargo_space:
                 loadout.append((weapon_choice, weapon_qty))
                 cargo_space -= total_cargo
+                if screen is not None:
+                    screen.update('message', [])
             else:
-                print("Not enough cargo space.")
+                show_message("Not enough cargo space.", screen)
         else:
-            print("Invalid weapon choice.")
+            show_message("Invalid weapon choice.", screen)
     return loadout
 
 # Основная функция игры
@@ -98,7 +154,16 @@ def main():
     stats = ship_stats(ship_choice)
     print(f"\nYou selected a ship with {stats['cargo_space']} units of cargo space.")
 
-    loadout = load_weapons(stats['cargo_space'])
+    # Полноэкранный режим для SSH/TCP-сессий: python main.py --screen
+    screen = create_screen() if "--screen" in sys.argv else None
+    if screen is not None:
+        show_ship_panel(screen, ship_choice, stats)
+        screen.update('weapons', weapons_table)
+    try:
+        loadout = load_weapons(stats['cargo_space'], screen)
+    finally:
+        if screen is not None:
+            screen.stop()
     print("\nYour ship is ready for battle with the following loadout:")
     for weapon, qty in loadout:
         print(f"{qty} units of Weapon {weapon}")
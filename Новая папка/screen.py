@@ -0,0 +1,120 @@
+import os
+import sys
+
+# Маркер "неизвестного" содержимого ячейки: никогда не совпадает с выводом
+UNKNOWN = '\0'
+
+# Разрыв между изменёнными участками строки, который дешевле перерисовать,
+# чем переставить курсор (ESC [ row ; col H занимает 6-8 байт)
+MERGE_GAP = 6
+
+
+# Полноэкранный терминальный вывод с фиксированными областями.
+# Хранит то, что уже показано на терминале, и при перерисовке
+# отправляет только изменившиеся ячейки.
+class ScreenRenderer:
+    def __init__(self, width=80, height=24, stream=None):
+        self.width = width
+        self.height = height
+        self.stream = stream or sys.stdout
+        self.regions = {}
+        self.back = [' ' * width for _ in range(height)]
+        self.front = [UNKNOWN * width for _ in range(height)]
+        self.bytes_written = 0
+        self.started = False
+
+    # Функция для объявления области экрана
+    def add_region(self, name, top, height):
+        if top < 0 or top + height > self.height:
+            raise ValueError(f"Region {name!r} does not fit on the screen")
+        self.regions[name] = (top, height)
+
+    # Функция для записи строк в область (без вывода на терминал)
+    def update(self, name, lines):
+        top, height = self.regions[name]
+        lines = list(lines)[:height]
+        lines += [''] * (height - len(lines))
+        for offset, line in enumerate(lines):
+            self.back[top + offset] = line[:self.width].ljust(self.width)
+
+    # Функция для отправки изменений на терминал
+    def refresh(self):
+        if not self.started:
+            self.start()
+        out = []
+        for row in range(self.height):
+            new = self.back[row]
+            old = self.front[row]
+            if new == old:
+                continue
+            for start, end in self._changed_runs(old, new):
+                out.append(f"\033[{row + 1};{start + 1}H{new[start:end]}")
+            self.front[row] = new
+        if out:
+            self._write(''.join(out))
+
+    # Функция для запроса ввода в строке области
+    def ask(self, name, prompt):
+        self.update(name, [prompt])
+        self.refresh()
+        top, _ = self.regions[name]
+        self._write(f"\033[{top + 1};{min(len(prompt), self.width - 1) + 1}H")
+        answer = input()
+        # Терминал сам вывел введённый текст после подсказки.
+        # Длинный ответ переносится на следующие строки, их содержимое неизвестно
+        echoed = prompt + answer
+        self.front[top] = echoed[:self.width].ljust(self.width)
+        wrapped_rows = len(echoed) // self.width
+        if top + wrapped_rows + 1 >= self.height:
+            # Перевод строки после ввода прокрутил экран: перерисуем всё
+            for row in range(self.height):
+                self.invalidate(row)
+        else:
+            for row in range(top + 1, top + wrapped_rows + 1):
+                self.invalidate(row)
+        return answer
+
+    # Функция для пометки строки как неизвестной (перерисуется целиком)
+    def invalidate(self, row):
+        self.front[row] = UNKNOWN * self.width
+
+    # Функция для очистки терминала и перехода в полноэкранный режим
+    def start(self):
+        if os.name == 'nt':
+            os.system('')  # Включает обработку ANSI-последовательностей в Windows
+        self._write("\033[2J\033[H")
+        self.front = [' ' * self.width for _ in range(self.height)]
+        self.started = True
+
+    # Функция для выхода из полноэкранного режима
+    def stop(self):
+        if self.started:
+            self._write(f"\033[{self.height};1H\n")
+            self.started = False
+
+    def _changed_runs(self, old, new):
+        runs = []
+        col = 0
+        while col < self.width:
+            if old[col] == new[col]:
+                col += 1
+                continue
+            start = col
+            end = col + 1
+            gap = 0
+            col += 1
+            while col < self.width and gap <= MERGE_GAP:
+                if old[col] != new[col]:
+                    end = col + 1
+                    gap = 0
+                else:
+                    gap += 1
+                col += 1
+            runs.append((start, end))
+            col = end
+        return runs
+
+    def _write(self, data):
+        self.stream.write(data)
+        self.stream.flush()
+        self.bytes_written += len(data.encode('utf-8'))
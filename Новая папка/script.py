@@ -1,6 +1,9 @@
 from browser import document
+from encounters import systems, spawn_enemy
+from enemy_ai import EnemyAI, HEAVY, SHIELD, REPAIR, REPAIRS, SHIELD_READY, shielded_damage
 
 # Переменные для отслеживания состояния
+current_system = 1
 ship_stats = {'speed': 0, 'cargo_space': 0, 'protection': 0}
 cargo_used = 0
 weapons = {
@@ -10,6 +13,9 @@ weapons = {
     4: {'name': 'Photon Torpedo', 'cargo': 2, 'strength': 10},
 }
 loadout = []
+opponent_ai = False
+ai_time_budget = 0.05  # Время на ход компьютерного противника (сек), задаёт сложность
+ai_debug = False  # Выводить статистику поиска (узлы/с) для настройки ai_time_budget
 
 # Функция для вывода текста в консоль
 def print_text(text):
@@ -42,8 +48,22 @@ def game_intro():
     print_text("1. SCOUT     10X        16            1")
     print_text("2. CRUISER    4X        24            2")
     print_text("3. BATTLESHIP 2X        30            5")
-    print_text("<br>Select a ship (1-3):")
-    get_input("Choose a ship (1-3):", choose_ship)
+    print_text("<br>You have a choice of three systems to patrol:")
+    for number, name in systems.items():
+        print_text(f"{number}. {name.upper()}")
+    get_input("Select a system (1-3):", choose_system)
+
+# Обработка выбора системы
+def choose_system(choice):
+    global current_system
+    if choice in ['1', '2', '3']:
+        current_system = int(choice)
+        print_text(f"You are patrolling the {systems[current_system]} system.")
+        print_text("<br>Select a ship (1-3):")
+        get_input("Choose a ship (1-3):", choose_ship)
+    else:
+        print_text("Invalid choice. Please select 1, 2, or 3.")
+        get_input("Select a system (1-3):", choose_system)
 
 # Обработка выбора корабля
 def choose_ship(choice):
@@ -84,8 +104,8 @@ def choose_weapons():
 def weapon_choice(choice):
     global cargo_used, loadout
     if choice in ['1', '2', '3', '4']:
-        weapon_choice = int(choice)
-        weapon = weapons[weapon_choice]
+        weapon_number = int(choice)
+        weapon = weapons[weapon_number]
 
         # Проверяем, есть ли уже это оружие в списке
         if any(w['name'] == weapon['name'] for w in loadout):
@@ -106,15 +126,27 @@ def weapon_choice(choice):
         print_text("Invalid choice. Please select 1-4.")
         get_input("Choose a weapon (1-4):", weapon_choice)
 
-# Переход к бою
+# Выбор противника перед боем
 def start_battle():
-    # Создаём врага
-    enemy = {
-        'name': 'Alien Destroyer',
-        'health': 50,  # Здоровье врага
-        'protection': 3,  # Защита врага
-        'attack': 5  # Сила атаки врага
-    }
+    print_text("<br>Choose your opponent:")
+    print_text("1. STANDARD")
+    print_text("2. TACTICAL AI")
+    get_input("Select an opponent (1-2):", choose_opponent)
+
+# Обработка выбора противника
+def choose_opponent(choice):
+    global opponent_ai
+    if choice in ['1', '2']:
+        opponent_ai = choice == '2'
+        begin_battle()
+    else:
+        print_text("Invalid choice. Please select 1 or 2.")
+        get_input("Select an opponent (1-2):", choose_opponent)
+
+# Переход к бою
+def begin_battle():
+    # Создаём врага по таблице встреч текущей системы
+    enemy = spawn_enemy(current_system)
 
     print_text("<br>=== BATTLE INITIATED ===")
     print_text(f"You are now engaging {enemy['name']} in battle! Use your weapons wisely.")
@@ -126,16 +158,30 @@ def start_battle():
     # Переходим к циклу боя
     battle_cycle(enemy)
 
-# Функция для обработки боя
 # Функция для обработки боя
 def battle_cycle(enemy):
     # Здоровье корабля игрока
     player_health = 30
+    # Состояние тактического противника
+    shield = SHIELD_READY
+    repairs = REPAIRS
+    ai = None
+    if opponent_ai:
+        ai = EnemyAI(
+            player_damage=sum(weapon['strength'] for weapon in loadout),
+            player_protection=ship_stats['protection'],
+            enemy_attack=enemy['attack'],
+            enemy_protection=enemy['protection'],
+            enemy_max_health=enemy['health'],
+            player_max_health=player_health,
+            time_budget=ai_time_budget,
+        )
 
     def player_attack():
         nonlocal enemy
         total_damage = sum(weapon['strength'] for weapon in loadout)
         damage_dealt = max(0, total_damage - enemy['protection'])  # Урон с учётом защиты врага
+        damage_dealt = shielded_damage(shield, damage_dealt)  # Щиты тактического противника
         enemy['health'] -= damage_dealt
         print_text(f"<br>You dealt {damage_dealt} damage to {enemy['name']}. {enemy['name']} has {enemy['health']} health remaining.")
 
@@ -148,7 +194,13 @@ def battle_cycle(enemy):
 
     def enemy_attack():
         nonlocal player_health
-        damage_dealt = max(0, enemy['attack'] - ship_stats['protection'])  # Урон с учётом защиты игрока
+        if ai is None:
+            damage_dealt = max(0, enemy['attack'] - ship_stats['protection'])  # Урон с учётом защиты игрока
+        else:
+            damage_dealt = enemy_tactical_move()
+            if damage_dealt is None:
+                player_attack()  # Враг не стрелял в этот ход
+                return
         player_health -= damage_dealt
         print_text(f"{enemy['name']} dealt {damage_dealt} damage to your ship. Your ship has {player_health} health remaining.")
 
@@ -160,6 +212,27 @@ def battle_cycle(enemy):
         # Продолжаем цикл боя
         player_attack()
 
+    def enemy_tactical_move():
+        nonlocal shield, repairs
+        state = (player_health, enemy['health'], shield, repairs)
+        action = ai.choose_action(state)
+        if ai_debug:
+            stats = ai.last_stats
+            print_text(f"[AI: {stats['nodes']} nodes in {stats['elapsed'] * 1000:.0f} ms, "
+                       f"{stats['nodes_per_second']:.0f} nodes/s, table {stats['tt_size']}]")
+
+        # Правила действий общие с поиском: EnemyAI.apply_action
+        (_, enemy['health'], shield, repairs), damage_dealt = ai.apply_action(state, action)
+        if action == SHIELD:
+            print_text(f"{enemy['name']} raises its shields.")
+            return None
+        if action == REPAIR:
+            print_text(f"{enemy['name']} repairs its hull. {enemy['name']} has {enemy['health']} health.")
+            return None
+        if action == HEAVY and damage_dealt == 0:
+            print_text(f"{enemy['name']} fires a heavy volley and misses!")
+        return damage_dealt
+
     # Начинаем с атаки игрока
     player_attack()
 # Функция для завершения игры
@@ -3,15 +3,32 @@ from unittest.mock import patch
 from io import StringIO
 import sys
 import re
-from typing import List, Tuple, Dict
+import time
+import cProfile
+import pstats
+import tracemalloc
+import os
+import random
+from collections import Counter, defaultdict
+from typing import List, Tuple, Dict, Optional
 import difflib
+import importlib
+import tempfile
+
+import fake_browser
+import encounters
+import loadouts
+import enemy_ai
+from screen import ScreenRenderer
 
 class GameTestCase:
-    def __init__(self, name: str, inputs: List[str], expected_outputs: List[str], description: str = ""):
+    def __init__(self, name: str, inputs: List[str], expected_outputs: List[str], description: str = "",
+                 target: str = "console"):
         self.name = name
         self.inputs = inputs
         self.expected_outputs = expected_outputs
         self.description = description
+        self.target = target  # "console" - консольная версия, "web" - script.py
 
 
 class DeepSpaceTestFramework(unittest.TestCase):
@@ -70,6 +87,8 @@ class DeepSpaceTestFramework(unittest.TestCase):
 
     def run_test_case(self, test_case: GameTestCase) -> Dict:
         """Запускает тестовый сценарий и возвращает результаты"""
+        if test_case.target == "web":
+            return self.run_web_test_case(test_case)
         try:
             with patch('builtins.input', side_effect=test_case.inputs), \
                     patch('console_game.battle_cycle', return_value=None), \
@@ -116,15 +135,284 @@ class DeepSpaceTestFramework(unittest.TestCase):
                 'output': ''
             }
 
+    def run_web_test_case(self, test_case: GameTestCase) -> Dict:
+        """Запускает сценарий веб-версии (script.py) с заменой browser.document"""
+        try:
+            document = fake_browser.install()
+            document.reset()
+
+            # Загрузка script.py заново сбрасывает все его глобальные переменные
+            # и, как на странице, сама запускает game_intro()
+            if 'script' in sys.modules:
+                importlib.reload(sys.modules['script'])
+            else:
+                import script
+
+            for user_input in test_case.inputs:
+                if not document.submit(user_input):
+                    break  # Игра больше не ждёт ввода
+
+            output_lines = document.console_lines()
+            is_match, diff = self._compare_outputs(output_lines, test_case.expected_outputs)
+
+            return {
+                'name': test_case.name,
+                'description': test_case.description,
+                'status': 'PASS' if is_match else 'FAIL',
+                'error': None,
+                'diff': diff if not is_match else None,
+                'output': '\n'.join(self._filter_battle_output(output_lines))
+            }
+
+        except Exception as e:
+            import traceback
+            return {
+                'name': test_case.name,
+                'description': test_case.description,
+                'status': 'ERROR',
+                'error': f"Error during test execution: {str(e)}\n{traceback.format_exc()}",
+                'diff': None,
+                'output': ''
+            }
+
+
+class EncounterSamplingTest(unittest.TestCase):
+    def test_sampled_frequencies_match_weights(self):
+        """Частоты выбранных врагов совпадают с весами таблиц встреч"""
+        rng = random.Random(2024)
+        draws = 200000
+        for system, entries in encounters.encounter_tables.items():
+            counts = Counter(encounters.sample_encounters(system, draws, rng))
+            total = sum(weight for enemy, weight in entries)
+            self.assertEqual(set(counts), {enemy for enemy, weight in entries})
+            for enemy, weight in entries:
+                self.assertAlmostEqual(counts[enemy] / draws, weight / total, delta=0.01)
+
+    def test_negative_weight_rejected(self):
+        """Отрицательный вес в таблице встреч считается ошибкой"""
+        with self.assertRaises(ValueError):
+            encounters.compile_encounter_table([(1, 1), (2, -1), (3, 5)])
+
+
+class EnemyAITest(unittest.TestCase):
+    def _ai(self, **kwargs) -> enemy_ai.EnemyAI:
+        params = dict(player_damage=14, player_protection=1, enemy_attack=7, enemy_protection=4,
+                      enemy_max_health=80, time_budget=0.02, rng=random.Random(7))
+        params.update(kwargs)
+        return enemy_ai.EnemyAI(**params)
+
+    def test_choose_action_is_legal_and_within_budget(self):
+        """Выбранное действие допустимо, поиск укладывается в бюджет времени"""
+        ai = self._ai()
+        for state in [(30, 80, enemy_ai.SHIELD_READY, 2), (12, 40, enemy_ai.SHIELD_RECHARGE, 0)]:
+            action = ai.choose_action(state)
+            self.assertIn(action, ai.legal_actions(state))
+            self.assertGreater(ai.last_stats['nodes'], 0)
+            self.assertLess(ai.last_stats['elapsed'], ai.time_budget + 0.05)
+
+    def test_table_is_bounded(self):
+        """Таблица транспозиций не превышает table_size и вытесняет узлы"""
+        ai = self._ai(table_size=1)
+        ai.choose_action((30, 80, enemy_ai.SHIELD_READY, 2))
+        self.assertLessEqual(len(ai.table), 1)
+        self.assertGreater(ai.evictions, 0)
+
+        ai = self._ai(table_size=50)
+        for _ in range(3):
+            ai.choose_action((30, 80, enemy_ai.SHIELD_READY, 2))
+            self.assertLessEqual(ai.last_stats['tt_size'], 50)
+
+    def test_legal_actions(self):
+        """Щиты нельзя поднять при перезарядке, ремонт - без запаса или при полном здоровье"""
+        ai = self._ai()
+        self.assertNotIn(enemy_ai.SHIELD, ai.legal_actions((30, 50, enemy_ai.SHIELD_RECHARGE, 2)))
+        self.assertIn(enemy_ai.SHIELD, ai.legal_actions((30, 50, enemy_ai.SHIELD_READY, 2)))
+        self.assertNotIn(enemy_ai.REPAIR, ai.legal_actions((30, 50, enemy_ai.SHIELD_READY, 0)))
+        self.assertNotIn(enemy_ai.REPAIR, ai.legal_actions((30, 80, enemy_ai.SHIELD_READY, 2)))
+        self.assertIn(enemy_ai.REPAIR, ai.legal_actions((30, 50, enemy_ai.SHIELD_READY, 2)))
+
+    def test_shield_halves_player_hit(self):
+        """После SHIELD атака игрока наносит половину урона"""
+        ai = self._ai(player_damage=24, enemy_protection=4)
+        state = (30, 80, enemy_ai.SHIELD_READY, 2)
+        shielded, _ = ai.step(state, enemy_ai.SHIELD)
+        attacked, _ = ai.step(state, enemy_ai.ATTACK)
+        self.assertEqual(shielded[1], 80 - 10)
+        self.assertEqual(shielded[2], enemy_ai.SHIELD_RECHARGE)
+        self.assertEqual(attacked[1], 80 - 20)
+
+
+class LoadoutIndexTest(unittest.TestCase):
+    def test_rank_unrank_round_trip(self):
+        """rank и unrank взаимно обратны для всех загрузок каждого корабля"""
+        for choice in (1, 2, 3):
+            for web in (False, True):
+                index = loadouts.index_for_ship(choice, web)
+                total = 0
+                for number, counts in enumerate(index):
+                    self.assertEqual(index.rank(counts), number)
+                    self.assertEqual(index.unrank(number), counts)
+                    self.assertEqual(index.cargo_used(counts), index.cargo_space)
+                    total += 1
+                self.assertEqual(total, len(index))
+
+    def test_invalid_counts_rejected(self):
+        """Некорректные векторы количеств вызывают ошибку"""
+        index = loadouts.index_for_ship(1)
+        with self.assertRaises(ValueError):
+            index.rank((1, -1, 0, 3, 0))
+        with self.assertRaises(TypeError):
+            index.rank((1, 0.5, 0, 1, 0))
+        with self.assertRaises(ValueError):
+            index.rank((0, 0, 0, 0, 0))  # Отсек не заполнен
+        with self.assertRaises(ValueError):
+            loadouts.index_for_ship(1, web=True).rank((0, 2, 2, 0))  # Оружие дважды
+
+
+class ScreenRendererTest(unittest.TestCase):
+    def _screen(self, width: int = 20, height: int = 5) -> ScreenRenderer:
+        screen = ScreenRenderer(width=width, height=height, stream=StringIO())
+        screen.add_region('text', 0, 1)
+        screen.add_region('prompt', 2, 1)
+        return screen
+
+    def _refresh(self, screen: ScreenRenderer) -> Tuple[str, int]:
+        """Перерисовывает экран, возвращает отправленный текст и число байт"""
+        start, written = len(screen.stream.getvalue()), screen.bytes_written
+        screen.refresh()
+        return screen.stream.getvalue()[start:], screen.bytes_written - written
+
+    def test_single_cell_change(self):
+        """Изменение одной ячейки - одно перемещение курсора и сама ячейка"""
+        screen = self._screen()
+        screen.update('text', ["hello"])
+        self._refresh(screen)
+        screen.update('text', ["hellp"])
+        self.assertEqual(self._refresh(screen), ("\033[1;5Hp", 7))
+
+    def test_unchanged_refresh_is_silent(self):
+        """Повторная перерисовка без изменений ничего не отправляет"""
+        screen = self._screen()
+        screen.update('text', ["hello"])
+        self._refresh(screen)
+        self.assertEqual(self._refresh(screen), ("", 0))
+
+    def test_close_changes_are_merged(self):
+        """Близкие изменения отправляются одним участком, далёкие - отдельными"""
+        screen = self._screen()
+        screen.update('text', ["abcdefghijklmnopqrst"])
+        self._refresh(screen)
+        screen.update('text', ["Xbcdefghijklmnopqrs!"])
+        self.assertEqual(self._refresh(screen)[0], "\033[1;1HX\033[1;20H!")
+        screen.update('text', ["xbcDefghijklmnopqrs!"])
+        self.assertEqual(self._refresh(screen)[0], "\033[1;1HxbcD")
+
+    def test_wrapped_answer_rows_redrawn(self):
+        """Строки, на которые перенёсся длинный ответ, перерисовываются"""
+        screen = self._screen()
+        screen.update('text', ["status"])
+        with patch('builtins.input', return_value="y" * 30):
+            screen.ask('prompt', "> ")
+        output, _ = self._refresh(screen)
+        self.assertIn("\033[4;1H" + " " * 20, output)
+        self.assertNotIn("\033[1;", output)
+
+    def test_scrolled_screen_fully_redrawn(self):
+        """Если ввод прокрутил экран, перерисовывается весь экран"""
+        screen = self._screen(height=4)
+        screen.update('text', ["status"])
+        with patch('builtins.input', return_value="y" * 30):
+            screen.ask('prompt', "> ")
+        output, _ = self._refresh(screen)
+        self.assertIn("\033[1;1Hstatus", output)
+
+
+def _function_label(func: Tuple[str, int, str]) -> str:
+    """Формирует имя функции для отчёта профилирования"""
+    filename, line, name = func
+    if filename == '~':
+        return name
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+def _top_functions(stats: pstats.Stats, limit: int) -> List[Tuple[str, int, float, float]]:
+    """Возвращает функции с наибольшим накопленным временем: (имя, вызовы, tottime, cumtime)"""
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+    return [(_function_label(func), nc, tt, ct) for func, (cc, nc, tt, ct, callers) in rows[:limit]]
+
+
+def _measure_peak_memory(test_framework: DeepSpaceTestFramework, test_case: GameTestCase) -> int:
+    """Повторно запускает сценарий под tracemalloc и возвращает пик выделенной памяти в байтах"""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        # Уже запущенную трассировку (например, -X tracemalloc) не останавливаем
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        test_framework.setUp()
+        try:
+            test_framework.run_test_case(test_case)
+        finally:
+            test_framework.tearDown()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+    return max(0, peak - baseline)
+
+
+def write_folded_stacks(stats: pstats.Stats, path: str):
+    """Сохраняет профиль в формате свёрнутых стеков (flamegraph.pl, speedscope, inferno).
+
+    cProfile хранит только пары вызывающий-вызываемый, поэтому время функции
+    распределяется по стекам пропорционально времени, полученному через каждого вызывающего.
+    """
+    callees = defaultdict(dict)
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]
 
-def run_all_tests():
-    """Запускает все тестовые сценарии и выводит результаты"""
+    folded = defaultdict(int)
+
+    def walk(func, stack, labels, share):
+        cc, nc, tt, ct, callers = stats.stats[func]
+        labels = labels + [_function_label(func).replace(';', ':')]
+        self_time = int(tt * share * 1e6)
+        if self_time > 0:
+            folded[';'.join(labels)] += self_time
+        for callee, edge_time in callees[func].items():
+            callee_time = stats.stats[callee][3]
+            callee_share = share * edge_time / callee_time if callee_time > 0 else 0.0
+            # Пропускаем рекурсию и ветки короче микросекунды
+            if callee in stack or callee_share * callee_time < 1e-6:
+                continue
+            walk(callee, stack | {callee}, labels, callee_share)
+
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        if not callers:
+            walk(func, {func}, [], 1.0)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        for stack, microseconds in sorted(folded.items()):
+            f.write(f"{stack} {microseconds}\n")
+
+
+def run_all_tests(profile: bool = False, profile_output: Optional[str] = None, profile_top: int = 10):
+    """Запускает все тестовые сценарии и выводит результаты.
+
+    profile - профилировать каждый сценарий: время через cProfile, затем пик памяти
+    через tracemalloc в отдельном прогоне, чтобы трассировка не искажала время,
+    profile_output - путь без расширения для общего профиля (.prof и .folded).
+    """
     if not TEST_CASES:
         print("No test cases defined!")
         return
 
     test_framework = DeepSpaceTestFramework()
     results = []
+    profiles = []
+    combined_stats = None
 
     print("\n" + "=" * 80)
     print("=== Starting DeepSpace Game Tests ===".center(80))
@@ -143,13 +431,21 @@ def run_all_tests():
         test_start_time = time.time()
 
         test_framework.setUp()
+        if profile:
+            profiler = cProfile.Profile()
+            profiler.enable()
         result = test_framework.run_test_case(test_case)
+        if profile:
+            profiler.disable()
         results.append(result)
         test_framework.tearDown()
 
         test_end_time = time.time()
         test_duration = test_end_time - test_start_time
 
+        if profile:
+            peak_memory = _measure_peak_memory(test_framework, test_case)
+
         print(f"\nTest Status: {result['status']}")
         print(f"Test Duration: {test_duration:.3f} seconds")
 
@@ -163,6 +459,18 @@ def run_all_tests():
             print("-" * 40)
             print(result['diff'])
 
+        if profile:
+            stats = pstats.Stats(profiler)
+            combined_stats = stats if combined_stats is None else combined_stats.add(profiler)
+            profiles.append((test_case.name, stats.total_tt, peak_memory))
+
+            print(f"\nPeak Allocated Memory: {peak_memory / 1024:.1f} KiB (separate tracemalloc run)")
+            print(f"\nTop {profile_top} functions by cumulative time:")
+            print("-" * 40)
+            print(f"  {'ncalls':>8} {'tottime':>9} {'cumtime':>9}  function")
+            for label, ncalls, tottime, cumtime in _top_functions(stats, profile_top):
+                print(f"  {ncalls:>8} {tottime:>9.4f} {cumtime:>9.4f}  {label}")
+
         print("\nTest Output Preview:")
         print("-" * 40)
         output_lines = result['output'].split('\n')
@@ -217,6 +525,77 @@ def run_all_tests():
     print(f"\nFinal Success Rate: {success_color}{(passed_tests / total_tests) * 100:.2f}%{reset_color}")
     print("\n" + "=" * 80)
 
+    if profile:
+        print("\n" + "=" * 80)
+        print("=== Profiling Summary ===".center(80))
+        print("=" * 80)
+        print(f"\n{'Scenario':<30} {'Profiled, s':>12} {'Peak memory, KiB':>18}")
+        print("-" * 62)
+        for name, profiled_time, peak_memory in profiles:
+            print(f"{name:<30} {profiled_time:>12.4f} {peak_memory / 1024:>18.1f}")
+
+        if profile_output and combined_stats is not None:
+            combined_stats.dump_stats(profile_output + '.prof')
+            write_folded_stacks(combined_stats, profile_output + '.folded')
+            print(f"\nCombined profile saved to {profile_output}.prof (pstats, snakeviz)")
+            print(f"Folded stacks saved to {profile_output}.folded (flamegraph.pl, speedscope)")
+        print("\n" + "=" * 80)
+
+
+def _busy(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def _recursive(depth: int) -> int:
+    return _busy(2000) if depth == 0 else _recursive(depth - 1) + _busy(500)
+
+
+def _profiled_tree() -> int:
+    return _busy(20000) + _recursive(5) + sum(_busy(3000) for _ in range(5))
+
+
+class ProfilingTest(unittest.TestCase):
+    def test_folded_stacks(self):
+        """Свёрнутые стеки имеют формат "frame;frame <int>" и покрывают всё время профиля"""
+        profiler = cProfile.Profile()
+        profiler.runcall(_profiled_tree)
+        stats = pstats.Stats(profiler)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'profile.folded')
+            write_folded_stacks(stats, path)
+            with open(path, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+
+        self.assertTrue(lines)
+        total = 0
+        for line in lines:
+            match = re.fullmatch(r'(.+) (\d+)', line)
+            self.assertIsNotNone(match, line)
+            self.assertTrue(all(frame.strip() for frame in match.group(1).split(';')), line)
+            total += int(match.group(2))
+        self.assertTrue(any('_recursive' in line for line in lines))
+        self.assertAlmostEqual(total / 1e6, stats.total_tt, delta=stats.total_tt * 0.05)
+
+    def test_peak_memory_keeps_tracing_state(self):
+        """_measure_peak_memory оставляет трассировку памяти в исходном состоянии"""
+        test_framework = DeepSpaceTestFramework()
+        test_case = next(case for case in TEST_CASES if case.target == "web")
+        was_tracing = tracemalloc.is_tracing()
+        try:
+            tracemalloc.stop()
+            self.assertGreater(_measure_peak_memory(test_framework, test_case), 0)
+            self.assertFalse(tracemalloc.is_tracing())
+
+            tracemalloc.start()
+            self.assertGreater(_measure_peak_memory(test_framework, test_case), 0)
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            if was_tracing and not tracemalloc.is_tracing():
+                tracemalloc.start()
+            elif not was_tracing:
+                tracemalloc.stop()
+
 
 # Тестовые случаи
 # Добавим следующие тестовые случаи:
@@ -499,8 +878,197 @@ TEST_CASES = [
             "CARGO SPACE IS FULL",
             "WEAPON SELECTION COMPLETE"
         ]
+    ),
+
+    GameTestCase(
+        name="Web Full Game",
+        description="Веб-версия: выбор системы, корабля, оружия и противника",
+        target="web",
+        inputs=[
+            "2",      # Select Deneb system
+            "1",      # Select Scout
+            "1",      # Choose Phaser Banks
+            "2",      # Choose Anti-Matter Missile
+            "1"       # Standard opponent
+        ],
+        expected_outputs=[
+            "DEEPSPACE",
+            "CREATIVE COMPUTING",
+            "MORRISTOWN, NEW JERSEY",
+            "THIS IS DEEPSPACE, A TACTICAL SIMULATION OF SHIP TO SHIP COMBAT IN DEEP SPACE.",
+            "You are a captain assigned to patrol your empire's borders against hostile aliens.",
+            "You will select a ship and equip it with weapons, then engage in combat.",
+            "Ships have the following characteristics:",
+            "TYPE        SPEED   CARGO SPACE   PROTECTION",
+            "1. SCOUT     10X        16            1",
+            "2. CRUISER    4X        24            2",
+            "3. BATTLESHIP 2X        30            5",
+            "You have a choice of three systems to patrol:",
+            "1. ORION",
+            "2. DENEB",
+            "3. ARCTURUS",
+            "Select a system (1-3):",
+            "You are patrolling the Deneb system.",
+            "Select a ship (1-3):",
+            "Choose a ship (1-3):",
+            "You selected the SCOUT.",
+            "Now, select your weapons (available cargo space: 16):",
+            "1. PHASER BANKS (Cargo: 12, Strength: 4)",
+            "2. ANTI-MATTER MISSILE (Cargo: 4, Strength: 20)",
+            "3. HYPERSPACE LANCE (Cargo: 4, Strength: 16)",
+            "4. PHOTON TORPEDO (Cargo: 2, Strength: 10)",
+            "Choose a weapon (1-4):",
+            "You have chosen Phaser Banks. Remaining cargo space: 4",
+            "Now, select your weapons (available cargo space: 4):",
+            "1. PHASER BANKS (Cargo: 12, Strength: 4)",
+            "2. ANTI-MATTER MISSILE (Cargo: 4, Strength: 20)",
+            "3. HYPERSPACE LANCE (Cargo: 4, Strength: 16)",
+            "4. PHOTON TORPEDO (Cargo: 2, Strength: 10)",
+            "Choose a weapon (1-4):",
+            "You have chosen Anti-Matter Missile. Remaining cargo space: 0",
+            "Cargo space is full. Prepare for battle!",
+            "Choose your opponent:",
+            "1. STANDARD",
+            "2. TACTICAL AI",
+            "Select an opponent (1-2):"
+        ]
+    ),
+
+    GameTestCase(
+        name="Web Invalid Inputs Handling",
+        description="Веб-версия: обработка неверных и повторных вводов",
+        target="web",
+        inputs=[
+            "5",      # Invalid system choice
+            "1",      # Correct system choice
+            "9",      # Invalid ship choice
+            "1",      # Correct ship choice (Scout)
+            "7",      # Invalid weapon choice
+            "1",      # Choose Phaser Banks
+            "1",      # Phaser Banks again
+            "2",      # Choose Anti-Matter Missile
+            "3",      # Invalid opponent choice
+            "1"       # Standard opponent
+        ],
+        expected_outputs=[
+            "DEEPSPACE",
+            "CREATIVE COMPUTING",
+            "MORRISTOWN, NEW JERSEY",
+            "THIS IS DEEPSPACE, A TACTICAL SIMULATION OF SHIP TO SHIP COMBAT IN DEEP SPACE.",
+            "You are a captain assigned to patrol your empire's borders against hostile aliens.",
+            "You will select a ship and equip it with weapons, then engage in combat.",
+            "Ships have the following characteristics:",
+            "TYPE        SPEED   CARGO SPACE   PROTECTION",
+            "1. SCOUT     10X        16            1",
+            "2. CRUISER    4X        24            2",
+            "3. BATTLESHIP 2X        30            5",
+            "You have a choice of three systems to patrol:",
+            "1. ORION",
+            "2. DENEB",
+            "3. ARCTURUS",
+            "Select a system (1-3):",
+            "Invalid choice. Please select 1, 2, or 3.",
+            "Select a system (1-3):",
+            "You are patrolling the Orion system.",
+            "Select a ship (1-3):",
+            "Choose a ship (1-3):",
+            "Invalid choice. Please select 1, 2, or 3.",
+            "Choose a ship (1-3):",
+            "You selected the SCOUT.",
+            "Now, select your weapons (available cargo space: 16):",
+            "1. PHASER BANKS (Cargo: 12, Strength: 4)",
+            "2. ANTI-MATTER MISSILE (Cargo: 4, Strength: 20)",
+            "3. HYPERSPACE LANCE (Cargo: 4, Strength: 16)",
+            "4. PHOTON TORPEDO (Cargo: 2, Strength: 10)",
+            "Choose a weapon (1-4):",
+            "Invalid choice. Please select 1-4.",
+            "Choose a weapon (1-4):",
+            "You have chosen Phaser Banks. Remaining cargo space: 4",
+            "Now, select your weapons (available cargo space: 4):",
+            "1. PHASER BANKS (Cargo: 12, Strength: 4)",
+            "2. ANTI-MATTER MISSILE (Cargo: 4, Strength: 20)",
+            "3. HYPERSPACE LANCE (Cargo: 4, Strength: 16)",
+            "4. PHOTON TORPEDO (Cargo: 2, Strength: 10)",
+            "Choose a weapon (1-4):",
+            "You already have Phaser Banks in your loadout. Choose another weapon.",
+            "Now, select your weapons (available cargo space: 4):",
+            "1. PHASER BANKS (Cargo: 12, Strength: 4)",
+            "2. ANTI-MATTER MISSILE (Cargo: 4, Strength: 20)",
+            "3. HYPERSPACE LANCE (Cargo: 4, Strength: 16)",
+            "4. PHOTON TORPEDO (Cargo: 2, Strength: 10)",
+            "Choose a weapon (1-4):",
+            "You have chosen Anti-Matter Missile. Remaining cargo space: 0",
+            "Cargo space is full. Prepare for battle!",
+            "Choose your opponent:",
+            "1. STANDARD",
+            "2. TACTICAL AI",
+            "Select an opponent (1-2):",
+            "Invalid choice. Please select 1 or 2.",
+            "Select an opponent (1-2):"
+        ]
+    ),
+
+    GameTestCase(
+        name="Web Tactical Opponent",
+        description="Веб-версия: бой с компьютерным противником (MCTS)",
+        target="web",
+        inputs=[
+            "1",      # Select Orion system
+            "1",      # Select Scout
+            "1",      # Choose Phaser Banks
+            "2",      # Choose Anti-Matter Missile
+            "2"       # Tactical AI opponent
+        ],
+        expected_outputs=[
+            "DEEPSPACE",
+            "CREATIVE COMPUTING",
+            "MORRISTOWN, NEW JERSEY",
+            "THIS IS DEEPSPACE, A TACTICAL SIMULATION OF SHIP TO SHIP COMBAT IN DEEP SPACE.",
+            "You are a captain assigned to patrol your empire's borders against hostile aliens.",
+            "You will select a ship and equip it with weapons, then engage in combat.",
+            "Ships have the following characteristics:",
+            "TYPE        SPEED   CARGO SPACE   PROTECTION",
+            "1. SCOUT     10X        16            1",
+            "2. CRUISER    4X        24            2",
+            "3. BATTLESHIP 2X        30            5",
+            "You have a choice of three systems to patrol:",
+            "1. ORION",
+            "2. DENEB",
+            "3. ARCTURUS",
+            "Select a system (1-3):",
+            "You are patrolling the Orion system.",
+            "Select a ship (1-3):",
+            "Choose a ship (1-3):",
+            "You selected the SCOUT.",
+            "Now, select your weapons (available cargo space: 16):",
+            "1. PHASER BANKS (Cargo: 12, Strength: 4)",
+            "2. ANTI-MATTER MISSILE (Cargo: 4, Strength: 20)",
+            "3. HYPERSPACE LANCE (Cargo: 4, Strength: 16)",
+            "4. PHOTON TORPEDO (Cargo: 2, Strength: 10)",
+            "Choose a weapon (1-4):",
+            "You have chosen Phaser Banks. Remaining cargo space: 4",
+            "Now, select your weapons (available cargo space: 4):",
+            "1. PHASER BANKS (Cargo: 12, Strength: 4)",
+            "2. ANTI-MATTER MISSILE (Cargo: 4, Strength: 20)",
+            "3. HYPERSPACE LANCE (Cargo: 4, Strength: 16)",
+            "4. PHOTON TORPEDO (Cargo: 2, Strength: 10)",
+            "Choose a weapon (1-4):",
+            "You have chosen Anti-Matter Missile. Remaining cargo space: 0",
+            "Cargo space is full. Prepare for battle!",
+            "Choose your opponent:",
+            "1. STANDARD",
+            "2. TACTICAL AI",
+            "Select an opponent (1-2):"
+        ]
     )
 ]
 
 if __name__ == '__main__':
-    run_all_tests()
+    # python testce.py --profile [--profile-output=deepspace_profile] [--profile-top=20]
+    output_path = next((arg.split('=', 1)[1] for arg in sys.argv if arg.startswith('--profile-output=')), None)
+    top_arg = next((arg.split('=', 1)[1] for arg in sys.argv if arg.startswith('--profile-top=')), None)
+    if top_arg is not None and not (top_arg.isdigit() and int(top_arg) > 0):
+        sys.exit(f"--profile-top expects a positive integer, got {top_arg!r}")
+    run_all_tests(profile='--profile' in sys.argv or output_path is not None or top_arg is not None,
+                  profile_output=output_path,
+                  profile_top=int(top_arg) if top_arg is not None else 10)